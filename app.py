@@ -1,7 +1,97 @@
+import io
+import re
+import sys
+import tempfile
+
+import requests
 import streamlit as st
 import os
 import subprocess
 from src.downloader import YouTubeDownloader, StreamOption
+from src.io_uring_reader import UringWriter, open_for_download
+
+
+_HEIGHT_RE = re.compile(r"(\d+)")
+
+
+# Spill streamed downloads to disk only beyond this size; smaller videos
+# never leave memory.
+_SPOOL_MAX = 100 * 1024 * 1024
+
+
+def _stream_format_to_buffer(url: str, format_id: str) -> tuple:
+    """Pipe a single yt-dlp format through stdout into memory.
+
+    Skips the write-to-temp-dir-then-read-back cycle for formats that
+    need no merging or postprocessing. Downloads up to _SPOOL_MAX stay
+    in a BytesIO; larger ones spill to a temp file that is reopened via
+    open_for_download — both handle types st.download_button accepts,
+    unlike SpooledTemporaryFile. Cookie, header and geo-bypass flags are
+    forwarded so the subprocess behaves like the in-process downloader.
+
+    Returns ``(file_handle, spill_path)``; spill_path is None when
+    nothing touched disk, otherwise the caller owns its removal.
+    """
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "yt_dlp", "-q", "-f", format_id, "-o", "-",
+         *YouTubeDownloader.cli_transfer_args(), url],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=1 << 20,
+    )
+    chunks: list[bytes] = []
+    buffered = 0
+    writer = None
+    spill_path = None
+    try:
+        for chunk in iter(lambda: proc.stdout.read(1 << 20), b""):
+            if writer is None:
+                chunks.append(chunk)
+                buffered += len(chunk)
+                if buffered > _SPOOL_MAX:
+                    fd, spill_path = tempfile.mkstemp(suffix=".ytdl")
+                    os.close(fd)
+                    # Spills are the one write path the app owns, so they
+                    # go through io_uring fixed-buffer writes when the
+                    # bindings are present.
+                    try:
+                        writer = UringWriter(spill_path)
+                    except RuntimeError:
+                        writer = open(spill_path, "wb", buffering=1 << 20)
+                    for pending in chunks:
+                        writer.write(pending)
+                    chunks.clear()
+            else:
+                writer.write(chunk)
+        if proc.wait() != 0:
+            raise RuntimeError("yt-dlp exited with an error while streaming")
+    except Exception:
+        proc.kill()
+        if writer is not None:
+            writer.close()
+        if spill_path:
+            try:
+                os.remove(spill_path)
+            except OSError:
+                pass
+        raise
+    finally:
+        proc.stdout.close()
+    if writer is None:
+        return io.BytesIO(b"".join(chunks)), None
+    writer.close()
+    return open_for_download(spill_path), spill_path
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _get_thumbnail(url: str | None) -> bytes | None:
+    """Fetch thumbnail bytes once per URL; reruns are served from cache."""
+    if not url:
+        return None
+    try:
+        return requests.get(url, timeout=5).content
+    except Exception:
+        return None
 
 
 st.set_page_config(
@@ -11,20 +101,33 @@ st.set_page_config(
 )
 
 
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _get_downloader(url: str) -> YouTubeDownloader:
+    """One downloader per URL per process, with info already fetched.
+
+    st.cache_resource keeps the instance itself, so reruns for the same
+    URL skip both construction and the network fetch; the blocking
+    extract_info call runs at most once per URL. The ttl matches the
+    downloader's own info-cache TTL: googlevideo stream URLs expire, so
+    an unbounded resource would keep replaying dead URLs after a few
+    hours.
+    """
+    downloader = YouTubeDownloader(url)
+    downloader.fetch_info()
+    return downloader
+
+
 def get_available_resolutions(streams: list[StreamOption]) -> list[str]:
-    """Extract unique resolutions from available streams."""
-    resolutions = set()
+    """Extract unique resolutions from available streams, highest first."""
+    # Map each label to its height once, then sort by dict lookup — a
+    # C-level key function, cheaper than re-parsing per comparison.
+    heights: dict[str, int] = {}
     for s in streams:
-        if s.resolution:
-            resolutions.add(s.resolution)
-    
-    # Sort by resolution number (highest first)
-    def res_key(r):
-        import re
-        m = re.search(r"(\d+)", r)
-        return int(m.group(1)) if m else 0
-    
-    return sorted(resolutions, key=res_key, reverse=True)
+        if s.resolution and s.resolution not in heights:
+            m = _HEIGHT_RE.search(s.resolution)
+            if m:
+                heights[s.resolution] = int(m.group(1))
+    return sorted(heights, key=heights.__getitem__, reverse=True)
 
 
 def get_available_formats(streams: list[StreamOption]) -> list[str]:
@@ -32,15 +135,23 @@ def get_available_formats(streams: list[StreamOption]) -> list[str]:
     formats = set()
     for s in streams:
         if s.mime_type:
-            fmt = s.mime_type.split("/")[-1].upper()
-            formats.add(fmt)
+            formats.add(s.mime_type.rpartition("/")[2].upper())
     return sorted(formats)
 
 
 def main():
     st.title("🎬 YouTube Video Downloader")
     st.markdown("Download high-resolution videos from YouTube easily!")
-    
+
+    # Remove the temp file left over from a previous rerun, after its
+    # bytes have had a chance to stream to the browser.
+    leftover = st.session_state.pop("pending_cleanup", None)
+    if leftover and os.path.exists(leftover):
+        try:
+            os.remove(leftover)
+        except OSError:
+            pass
+
     # URL Input
     url = st.text_input("🔗 Enter YouTube URL", placeholder="https://www.youtube.com/watch?v=...")
     
@@ -53,13 +164,12 @@ def main():
             return
 
         try:
-            # Initialize downloader
-            downloader = YouTubeDownloader(url)
-            
-            # Fetch info & streams
+            # Initialize downloader (cached per URL across reruns)
             with st.spinner("Fetching video information..."):
-                info = downloader.fetch_info()
+                downloader = _get_downloader(url)
+                info = downloader.info
                 streams = downloader.fetch_streams()
+
             
             if not streams:
                 st.error("No streams available for this video.")
@@ -68,7 +178,7 @@ def main():
             # Display video thumbnail and info
             col1, col2 = st.columns([1, 2])
             with col1:
-                st.image(info.get('thumbnail'), width=200)
+                st.image(_get_thumbnail(info.get('thumbnail')) or info.get('thumbnail'), width=200)
             with col2:
                 st.subheader(info.get('title'))
                 st.write(f"**Author:** {info.get('uploader')}")
@@ -118,46 +228,64 @@ def main():
                     status_text = st.empty()
                     status_text.text("⏳ Downloading... This may take a while for large videos.")
                     progress_bar = st.progress(0.1)
-                    
-                    # Perform download to a temporary location
-                    temp_dir = "temp_downloads"
-                    os.makedirs(temp_dir, exist_ok=True)
-                    
-                    if download_type == "Video":
-                        file_path = downloader.download(
-                            chosen_stream.itag,
-                            output_path=temp_dir
-                        )
+
+                    # Progressive streams (audio+video in one format) need
+                    # no ffmpeg merge, so they can pipe straight from
+                    # yt-dlp's stdout into a spooled file — no temp dir,
+                    # no read-back. Merged video and audio extraction
+                    # still go through the temp-dir flow.
+                    streamable = (
+                        download_type == "Video"
+                        and chosen_stream.resolution
+                        and chosen_stream.abr
+                    )
+
+                    if streamable:
+                        file_handle, spill_path = _stream_format_to_buffer(url, chosen_stream.itag)
+                        file_name = f"{info.get('title', 'video')}.{chosen_stream.mime_type or 'mp4'}"
+                        if spill_path:
+                            st.session_state["pending_cleanup"] = spill_path
                     else:
-                        file_path = downloader.download_audio_only(
-                            output_path=temp_dir
-                        )
-                    
-                    if not file_path or not os.path.exists(file_path):
-                        st.error("Failed to retrieve file from server.")
-                        return
+                        # Perform download to a temporary location
+                        temp_dir = "temp_downloads"
+                        os.makedirs(temp_dir, exist_ok=True)
+
+                        if download_type == "Video":
+                            file_path = downloader.download(
+                                chosen_stream.itag,
+                                output_path=temp_dir
+                            )
+                        else:
+                            file_path = downloader.download_audio_only(
+                                output_path=temp_dir
+                            )
+
+                        if not file_path or not os.path.exists(file_path):
+                            st.error("Failed to retrieve file from server.")
+                            return
+
+                        # Hand Streamlit a file-like object so the payload
+                        # is not materialized as one bytes allocation on the
+                        # heap; on Linux with liburing installed the read
+                        # itself goes through batched io_uring submissions.
+                        file_handle = open_for_download(file_path)
+                        file_name = os.path.basename(file_path)
+
+                        # Defer cleanup to the next rerun so the handle can
+                        # outlive this script run while the browser downloads.
+                        st.session_state["pending_cleanup"] = file_path
 
                     progress_bar.progress(1.0)
                     status_text.text("✅ Downloaded to server. Ready for browser download!")
-                    
-                    # Read the file and provide download button
-                    with open(file_path, "rb") as f:
-                        file_data = f.read()
-                        
+
                     st.download_button(
                         label="📥 Click here to save to your device",
-                        data=file_data,
-                        file_name=os.path.basename(file_path),
+                        data=file_handle,
+                        file_name=file_name,
                         mime="video/mp4" if download_type == "Video" else "audio/mpeg",
                         use_container_width=True
                     )
-                    
-                    # Clean up the temp file after reading
-                    try:
-                        os.remove(file_path)
-                    except:
-                        pass
-                        
+
                 except Exception as e:
                     st.error(f"❌ Download failed: {str(e)}")
                     import traceback
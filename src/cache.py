@@ -1,46 +1,123 @@
+import atexit
 import json
 import os
+import tempfile
+import time
+from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson  # C-level JSON, ~5-10x faster on nested dicts
+except ImportError:
+    orjson = None
+
+# Minimum seconds between disk flushes; set() marks the data dirty and
+# the actual write is debounced so bursts of updates cost one rewrite.
+_FLUSH_INTERVAL = 1.0
+
 
 class Cache:
     """Simple JSON file cache for video metadata.
 
     Stores data under a single JSON file. Created per-user in the home directory.
+    Writes are atomic (tempfile + os.replace) and debounced; a final flush
+    is registered with atexit. Entries stored with a TTL expire on read.
     """
 
+    _instance: Optional["Cache"] = None
+
     def __init__(self, path: Optional[str] = None) -> None:
         self.path = path or os.path.expanduser("~/.youtube_downloader/cache.json")
         self._data: Dict[str, Any] = {}
+        self._dirty = False
+        self._last_flush = 0.0
+        self._mtime = 0.0
         self._ensure_dir()
         self._load()
+        atexit.register(self.flush)
+
+    @classmethod
+    def instance(cls) -> "Cache":
+        """Process-wide cache at the default path, constructed lazily.
+
+        YouTubeDownloader is rebuilt on every Streamlit rerun; sharing
+        one Cache avoids re-stat'ing and re-parsing cache.json each time.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
 
     def _ensure_dir(self) -> None:
         dirpath = os.path.dirname(self.path)
         if dirpath:
-            os.makedirs(dirpath, exist_ok=True)
+            Path(dirpath).mkdir(parents=True, exist_ok=True)
 
     def _load(self) -> None:
-        if os.path.exists(self.path):
-            try:
-                with open(self.path, "r", encoding="utf-8") as f:
-                    self._data = json.load(f)
-            except Exception:
-                self._data = {}
-        else:
+        try:
+            stat = os.stat(self.path)
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            self._data = orjson.loads(raw) if orjson else json.loads(raw)
+            self._mtime = stat.st_mtime
+        except Exception:
             self._data = {}
+            self._mtime = 0.0
+
+    def _maybe_reload(self) -> None:
+        # One stat per read detects external writers; the JSON re-parse
+        # only happens when the file actually changed underneath us.
+        if self._dirty:
+            return
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self._load()
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self._data.get(key, default)
+        self._maybe_reload()
+        value = self._data.get(key, default)
+        if isinstance(value, dict) and "_exp" in value:
+            if time.time() >= value["_exp"]:
+                return default
+            return value.get("_v")
+        return value
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if ttl is not None:
+            value = {"_exp": time.time() + ttl, "_v": value}
         self._data[key] = value
-        self._save()
+        self._dirty = True
+        if time.time() - self._last_flush >= _FLUSH_INTERVAL:
+            self.flush()
 
-    def _save(self) -> None:
+    def flush(self) -> None:
+        """Write pending changes to disk atomically."""
+        if not self._dirty:
+            return
         try:
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2)
+            if orjson:
+                payload = orjson.dumps(self._data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self._data, indent=2).encode("utf-8")
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            self._last_flush = time.time()
+            try:
+                self._mtime = os.stat(self.path).st_mtime
+            except OSError:
+                pass
         except Exception:
             # Best-effort save; don't crash the caller on caching issues
             pass
+
+    def _save(self) -> None:
+        # Kept for backwards compatibility; flush() is the real writer.
+        self.flush()
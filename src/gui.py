@@ -1,3 +1,5 @@
+import asyncio
+import queue
 import threading
 import os
 import tkinter as tk
@@ -15,8 +17,22 @@ class YouTubeDownloaderGUI:
         self.root = root or tk.Tk()
         self.root.title("YouTube Downloader – High Resolution")
         self.logger = logging.getLogger(__name__)
-        self.cache = Cache()
+        self.cache = Cache.instance()
+        # One background asyncio loop for all downloads: coroutines are
+        # scheduled onto it from the Tk thread, and multiple queued URLs
+        # overlap instead of each spawning its own thread.
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        # Workers write this plain int (atomic under the GIL); the Tk
+        # thread polls it at 20 Hz, so download throughput is decoupled
+        # from the UI frame rate.
+        self._progress_val = 0
+        # Status strings flow through this queue; workers never touch Tk
+        # variables directly, the drain loop below applies them.
+        self._ui_q: queue.SimpleQueue = queue.SimpleQueue()
         self._build_ui()
+        self.root.after(50, self._poll_progress)
+        self.root.after(50, self._drain_ui)
 
     def _build_ui(self) -> None:
         pad = 6
@@ -65,53 +81,82 @@ class YouTubeDownloaderGUI:
         if not url:
             messagebox.showwarning("Input required", "Please enter a YouTube video URL.")
             return
-        # Run download in a worker thread to keep GUI responsive
-        thread = threading.Thread(target=self._download_worker, args=(url,), daemon=True)
-        thread.start()
+        # Read widget state on the Tk thread, then hand the work to the
+        # background asyncio loop to keep the GUI responsive.
+        target_res = self.res_var.get()
+        asyncio.run_coroutine_threadsafe(self._adownload_worker(url, target_res), self.loop)
 
-    def _download_worker(self, url: str) -> None:
+    async def _adownload_worker(self, url: str, target_res: str) -> None:
         try:
-            self.status.set("Preparing download...")
-            downloader = YouTubeDownloaderGUI._make_downloader(url, self.logger)
-            streams = downloader.fetch_streams()
+            self._set_status("Preparing download...")
+            downloader = YouTubeDownloaderGUI._make_downloader(url, self.logger, self.cache)
+            streams = await downloader.afetch_streams()
             # Pick a stream by user-selected resolution
-            target_res = self.res_var.get()
             chosen = downloader.select_stream_for_resolution(streams, target_res)
             if chosen is None:
                 raise RuntimeError("No suitable stream found for the selected resolution.")
 
-            self.status.set(f"Downloading: {chosen.resolution or 'audio'}... (itag={chosen.itag})")
+            self._set_status(f"Downloading: {chosen.resolution or 'audio'}... (itag={chosen.itag})")
             self._update_progress(0)
             # Directory for downloads
             out_dir = os.path.abspath("downloads")
             os.makedirs(out_dir, exist_ok=True)
-            def progress_hook(block_num: int, block_size: int, total_size: int) -> None:
-                # PyTube on_progress signature: stream, chunk, bytes_remaining; adapt with a simple pct
-                try:
-                    if total_size:
-                        percent = int((block_num * block_size) / total_size * 100)
-                        self._update_progress(min(max(percent, 0), 100))
-                except Exception:
-                    pass
-
-            # Download
-            file_path = downloader.download(chosen.itag, output_path=out_dir, progress_cb=None)
-            self.status.set("Download complete: " + file_path)
+
+            # Download (fragments are fetched in parallel by yt-dlp);
+            # progress events stream through an asyncio.Queue so the
+            # downloader never reaches into GUI state.
+            progress_q: asyncio.Queue = asyncio.Queue()
+            pump = asyncio.ensure_future(self._pump_progress(progress_q))
+            file_path = await downloader.adownload(chosen.itag, output_path=out_dir,
+                                                   progress_queue=progress_q)
+            await pump
+            self._set_status("Download complete: " + file_path)
             self._update_progress(100)
         except Exception as exc:
             self.logger.exception("Download error: %s", str(exc))
-            self._show_error(f"Download failed: {exc}")
+            self.root.after(0, self._show_error, f"Download failed: {exc}")
+
+    async def _pump_progress(self, progress_q: asyncio.Queue) -> None:
+        while True:
+            event = await progress_q.get()
+            if event is None:
+                return
+            downloaded, total = event
+            if total:
+                self._update_progress(min(int(downloaded * 100 / total), 100))
+
+    def _set_status(self, message: str) -> None:
+        # Workers enqueue; the Tk thread drains. Keeps the worker off
+        # Tcl's interpreter lock entirely.
+        self._ui_q.put(message)
+
+    def _drain_ui(self) -> None:
+        message = None
+        try:
+            while True:
+                message = self._ui_q.get_nowait()
+        except queue.Empty:
+            pass
+        if message is not None:
+            self.status.set(message)
+        self.root.after(50, self._drain_ui)
 
     @staticmethod
-    def _make_downloader(url: str, logger: logging.Logger) -> YouTubeDownloader:
+    def _make_downloader(url: str, logger: logging.Logger, cache: Optional[Cache] = None) -> YouTubeDownloader:
         from .downloader import YouTubeDownloader
-        return YouTubeDownloader(url=url, logger=logger)
+        return YouTubeDownloader(url=url, logger=logger, cache=cache)
 
     def _update_progress(self, value: int) -> None:
+        self._progress_val = value
+
+    def _poll_progress(self) -> None:
+        value = self._progress_val
         try:
-            self.progress['value'] = value
+            if self.progress['value'] != value:
+                self.progress['value'] = value
         except Exception:
             pass
+        self.root.after(50, self._poll_progress)
 
     def _show_error(self, message: str) -> None:
         messagebox.showerror("Error", message)
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from src.cache import Cache
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmpdir.name, "cache.json")
+        self.cache = Cache(path=self.path)
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_set_get_roundtrip(self):
+        self.cache.set("k", {"a": 1})
+        self.assertEqual(self.cache.get("k"), {"a": 1})
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_flush_is_atomic_and_reloadable(self):
+        self.cache.set("k", [1, 2, 3])
+        self.cache.flush()
+        # A fresh instance must see the flushed data, and no .tmp file
+        # from the atomic replace may be left behind.
+        other = Cache(path=self.path)
+        self.assertEqual(other.get("k"), [1, 2, 3])
+        leftovers = [n for n in os.listdir(self._tmpdir.name) if n.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+    def test_ttl_expires_on_read(self):
+        self.cache.set("live", "v", ttl=60)
+        self.assertEqual(self.cache.get("live"), "v")
+        # A negative ttl is already in the past, so the entry expires
+        # immediately without sleeping in the test.
+        self.cache.set("dead", "v", ttl=-1)
+        self.assertIsNone(self.cache.get("dead"))
+
+    def test_writes_are_debounced(self):
+        # The first set flushes (nothing was written yet); a second set
+        # within the debounce interval only marks the data dirty.
+        self.cache.set("a", 1)
+        self.assertFalse(self.cache._dirty)
+        self.cache.set("b", 2)
+        self.assertTrue(self.cache._dirty)
+        with open(self.path, "rb") as f:
+            self.assertNotIn(b'"b"', f.read())
+        # An explicit flush writes the pending entry.
+        self.cache.flush()
+        self.assertFalse(self.cache._dirty)
+        with open(self.path, "rb") as f:
+            self.assertIn(b'"b"', f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
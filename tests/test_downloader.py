@@ -33,6 +33,98 @@ class TestYouTubeDownloader(unittest.TestCase):
         self.assertIsNotNone(chosen)
         self.assertEqual(chosen.resolution, "1080p")
 
+    def test_parse_resolution_k_labels(self):
+        dl = YouTubeDownloader(url="http://example")
+        self.assertEqual(dl._resolution_index("2K"), 1440)
+        self.assertEqual(dl._resolution_index("4K"), 2160)
+        self.assertEqual(dl._resolution_index("8k"), 4320)
+
+    def test_select_stream_for_resolution_k_label(self):
+        # "4K" must fall back to the best available stream, not parse as
+        # height 4 and pick the worst.
+        streams = [
+            StreamOption(itag=1, mime_type="video/mp4", resolution="1080p", fps=30, abr=None),
+            StreamOption(itag=2, mime_type="video/mp4", resolution="720p", fps=30, abr=None),
+            StreamOption(itag=3, mime_type="video/mp4", resolution="144p", fps=30, abr=None),
+        ]
+        dl = YouTubeDownloader(url="http://example")
+        chosen = dl.select_stream_for_resolution(streams, "4K")
+        self.assertEqual(chosen.resolution, "1080p")
+
+    def test_validate_url_accepts_youtube_shapes(self):
+        for url in (
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        ):
+            dl = YouTubeDownloader(url=url)
+            dl._validate_url()
+            self.assertEqual(dl.video_id, "dQw4w9WgXcQ")
+
+    def test_validate_url_rejects_non_youtube(self):
+        for url in ("", "http://example.com/watch?v=dQw4w9WgXcQ",
+                    "https://www.youtube.com/watch?v=short"):
+            dl = YouTubeDownloader(url=url)
+            with self.assertRaises(ValueError):
+                dl._validate_url()
+
+    def test_sanitize_info_strips_bulky_keys(self):
+        info = {
+            "title": "t",
+            "http_headers": {"User-Agent": "x"},
+            "formats": [
+                {"format_id": "137", "url": "u", "fragments": [1, 2],
+                 "http_headers": {"User-Agent": "x"}},
+            ],
+        }
+        slim = YouTubeDownloader._sanitize_info(info)
+        self.assertNotIn("http_headers", slim)
+        self.assertEqual(slim["title"], "t")
+        self.assertEqual(slim["formats"], [{"format_id": "137", "url": "u"}])
+
+    def test_fetch_streams_dedups_formats(self):
+        dl = YouTubeDownloader(url="http://example")
+        # Worst-to-best, the order yt-dlp uses; '137x' is a worse variant
+        # of the same (resolution, ext) pair and must lose to '137', the
+        # duplicated '137' id must only be counted once, and the
+        # storyboard entry (no audio, no video) must be filtered out.
+        dl.info = {"formats": [
+            {"format_id": "sb0", "ext": "mhtml", "vcodec": "none", "acodec": "none"},
+            {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a", "abr": 129},
+            {"format_id": "18", "ext": "mp4", "height": 360, "vcodec": "avc1", "acodec": "mp4a", "abr": 96},
+            {"format_id": "137x", "ext": "mp4", "height": 1080, "vcodec": "avc1", "acodec": "none"},
+            {"format_id": "137", "ext": "mp4", "height": 1080, "vcodec": "avc1", "acodec": "none"},
+            {"format_id": "137", "ext": "mp4", "height": 1080, "vcodec": "avc1", "acodec": "none"},
+        ]}
+        streams = dl.fetch_streams()
+        itags = {s.itag for s in streams}
+        self.assertEqual(itags, {"140", "18", "137"})
+        by_itag = {s.itag: s for s in streams}
+        self.assertEqual(by_itag["137"].resolution, "1080p")
+        self.assertIsNone(by_itag["140"].resolution)
+
+    def test_make_format_selector_merges_best_audio(self):
+        selector = YouTubeDownloader._make_format_selector("137")
+        ctx = {"formats": [
+            {"format_id": "137", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "protocol": "https"},
+            {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a", "abr": 129, "protocol": "https"},
+            {"format_id": "251", "ext": "webm", "vcodec": "none", "acodec": "opus", "abr": 160, "protocol": "https"},
+        ]}
+        chosen = list(selector(ctx))
+        self.assertEqual(len(chosen), 1)
+        self.assertEqual(chosen[0]["format_id"], "137+251")
+        self.assertEqual([f["format_id"] for f in chosen[0]["requested_formats"]], ["137", "251"])
+
+    def test_make_format_selector_progressive_passthrough(self):
+        selector = YouTubeDownloader._make_format_selector("18")
+        ctx = {"formats": [
+            {"format_id": "18", "ext": "mp4", "vcodec": "avc1", "acodec": "mp4a", "protocol": "https"},
+            {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a", "abr": 129, "protocol": "https"},
+        ]}
+        chosen = list(selector(ctx))
+        self.assertEqual(len(chosen), 1)
+        self.assertEqual(chosen[0]["format_id"], "18")
+
 
 if __name__ == '__main__':
     unittest.main()